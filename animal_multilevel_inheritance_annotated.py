@@ -1,68 +1,87 @@
 # Annotated multilevel inheritance example (not multiple inheritence)
 #     by: Alex Hoffman
 
-class Animal:
-    # class attribute - all animals are multicellular, thus
-    # all objects belonging to this class and ALL subclasses must
-    # inherit this class attribute.
+# Organism is the top of the class heirarchy. Both Animal and Bacterium
+# inherit from it, so things they share live here.
+class Organism:
+    # class attribute - Organism supplies a default value that
+    # all objects belonging to this class and ALL subclasses
+    # inherit unless a subclass overrides it. Animal inherits
+    # True as-is, and Bacterium overrides it with False.
     # class attributes must be assigned an initial value
     multicellular = True
+
+    # an empty __slots__ keeps Organism from adding a __dict__
+    # to every Animal (see Animal's __slots__ below)
+    __slots__ = ()
+
+
+# Animal inherits multicellular = True from Organism, so it doesn't
+# need to define it again.
+class Animal(Organism):
+    # __slots__ lists every instance attribute up front. Python then
+    # stores them in a fixed table instead of a per-instance __dict__,
+    # which makes each object smaller and attribute reads faster.
+    # subclasses add their own __slots__ for the attributes they create.
+    __slots__ = ('legs', '_tail', 'eats')
+
+    # a type annotation documents that eats holds a bool. it can't also
+    # have a class-level default here, because a class attribute with
+    # the same name as a slot is an error - the default is set in __init__
+    eats: bool
     
     # initialize instance attributes - not all animals have legs and tails,
     #     so it depends on the specific (instance) of Animal
     def __init__(self, legs, tail):
-        # the double_underscore (could be single underscore) indicates 
-        # the attribute is private. Python doesn't enforce 
-        # public/protected like c++/java.
-        self.__legs = legs
-        self.__tail = tail
+        # legs is a plain public attribute. A getter/setter pair that
+        # only returns/sets the value adds nothing but overhead, so
+        # callers just read and write obj.legs directly.
+        self.legs = legs
+
+        # the single underscore indicates the attribute is private.
+        # Python doesn't enforce public/protected like c++/java.
+        # (a double underscore would also mangle the name to
+        # _Animal__tail, so subclasses couldn't easily share it)
+        self._tail = tail
         
         # eats is public, so it can be accessed directly
-        # it also isn't initialized to a value, so it must be set
-        self.eats = bool
+        # it starts out False until it is set to something else
+        # (assigning "bool" here would store the bool type itself, not a value)
+        self.eats = False
     
     # In python, having an @xxx (any name) right on top of a function
     # definition is called a decorator. There are built-in decorators
     # like the @property decorator below or you can create your own.
     # The property decorator is similar to having a getter (accessor)
-    # in other languages. Here it just returns the attribute value.
+    # in other languages. This getter has some logic, which is
+    # when a property is worth having. java devs almost always
+    # have setters/getters for every attribute that you might want
+    # to access, so it can get overloading quickly.
     @property
-    def legs(self):
-        return self.__legs
+    def tail(self):
+        # a conditional expression: picks the first string if _tail is
+        # true, otherwise the second. it's a one-line if/else
+        return "has" if self._tail else "does not have"
     
     # A setter decorator is similar to having a setter (mutator)
     # in other languages. Here it lets you directly alter the attribute
     # after instantiation. There could be logic here if desired/needed.
-    @legs.setter
-    def legs(self, legs):
-        self.__legs = legs
-    
-    # This getter has some logic. many times you'll see a
-    # getter just return, like the legs getter above.
-    # java devs almost always have setters/getters for every
-    # attribute that you might want to access, so it can get
-    # overloading quickly.
-    @property
-    def tail(self):
-        if self.__tail == True:
-            return "has"
-        else:
-            return "does not have"
-    
     @tail.setter
     def tail(self, tail):
-        self.__tail = tail
+        self._tail = tail
     
     
 # Putting Animal in parenthesis here means that class Dog inherits
 # from class Animal. It inherits all attributes and methods.    
 class Dog(Animal):
+    __slots__ = ('name', '_sound')
+
     ## this init overrides the parent classes's init (constructor)
     # legs and tail have default values set to the average dog
     # but....(see more below)
     def __init__(self, name, legs=4, tail=True):
-        self.__name = name
-        self.__sound = "woof"
+        self.name = name
+        self._sound = "woof"
         
         # you have to explicitly call Parent class Animal's constructor
         # in order to invoke the parent (super) class's constructor
@@ -70,29 +89,22 @@ class Dog(Animal):
     
     # a bark function that is unique to Dogs (in this example)
     # I could have made a generic "sound()" function in the Animal
-    # superclass and each Animal have a __sound attribute,
+    # superclass and each Animal have a _sound attribute,
     # but I didn't want to :)
     def bark(self):
-        print(self.__sound)
-    
-    # other properties/setters similar to Animal...more of the same below, too
-    @property
-    def name(self):
-        return self.__name
-    
-    @name.setter
-    def name(self, name):
-        self.__name = name
+        print(self._sound)
         
 
 # class Reptile inherits from Animal, so you get all the 
 # attributes and actions from Animal as well as ones
 # created specifically for Reptile.
 class Reptile(Animal):
+    __slots__ = ('_scales',)
+
     # this also overrides the super class's default
     # constructor, but.... (see below)
     def __init__(self, legs, tail=True):
-        self.__scales = True
+        self._scales = True
         
         # here calling super() implicitly inherrits the
         # Animal super class constructor, so you don't have 
@@ -101,40 +113,42 @@ class Reptile(Animal):
     
     @property    
     def scales(self):
-        if self.__scales == True:
-            return "has"
-        else:
-            return "does not have"
+        return "has" if self._scales else "does not have"
         
     @scales.setter
     def scales(self, scales):
-        self.__scales = scales
+        self._scales = scales
 
 
 # this class doesn't have any implementation, so it works exactly like
-# its super class Reptile and Reptile's super class Animal
+# its super class Reptile and Reptile's super class Animal.
+# it still needs an (empty) __slots__ though - a subclass without one
+# gives every instance a __dict__ again, even if its parents have slots
 class Lizard(Reptile):
-    pass
+    __slots__ = ()
         
         
 # class Snake inherits from Reptile which inherits from Animal, so
 # you get all the attributes and actions from them as well as ones
 # created specifically for Snake.
 class Snake(Reptile):
+    __slots__ = ('_venom',)
+
     # note the default values for legs/tail and venom
     def __init__(self, legs=0, tail=True):
-        self.__venom = False
-        self.__tail = True
-        super().__init__(legs, self.__tail)
+        self._venom = False
+
+        # tail is stored once, in the _tail slot from Animal, so
+        # Snake's tail getter and Animal's tail getter read the same value
+        super().__init__(legs, tail)
         
     @property
     def venom(self):
-        if self.__venom == False: return "is not"
-        else: return "is"
+        return "is" if self._venom else "is not"
     
     @venom.setter
     def venom(self, has_venom):
-        self.__venom = has_venom
+        self._venom = has_venom
 
     # here, both of the tail functions override the parent
     # class's tail function, so invoking them will invoke this
@@ -142,29 +156,34 @@ class Snake(Reptile):
     # this is python polymorphism
     @property
     def tail(self):
-        if self.__tail == True:
-            return "is mostly"
-        else:
-            return "must be dead"
+        return "is mostly" if self._tail else "must be dead"
     
     @tail.setter
     def tail(self, tail):
-        self.__tail = tail
+        self._tail = tail
         
-# Bacterium is in a class heirarchy of its own at the same "top" level as Animal
-class Bacterium:
-    # class attribute - All bacteria are single-cellular
+# Bacterium is a sibling of Animal - both inherit from Organism
+class Bacterium(Organism):
+    # class attribute - All bacteria are single-cellular, so this
+    # overrides the value inherited from Organism
     multicellular = False
-    
 
-if __name__ == "__main__":
+    # no instance attributes, so an empty __slots__ keeps instances
+    # from getting a __dict__
+    __slots__ = ()
     
+
+# the demo lives in a function so its variables are fast locals
+# instead of module-level globals, and importing this file doesn't
+# run it. the "if __name__" check at the bottom calls it when the
+# file is run as a script.
+def main():
     # create (aka instantiate) a Dog object named George and do not override the defalt values
     george = Dog('George')
 
     print(f"Speak George!")
     george.bark()
-    # .name is implemented in Dog and .legs and .tail are inherited from Animal
+    # .name is set in Dog and .legs and .tail are inherited from Animal
     print(f"{george.name} has {george.legs} legs and {george.tail} a tail")
 
     # several print()s just for output spacing...
@@ -176,7 +195,7 @@ if __name__ == "__main__":
     print(f"Speak Fido!")
     fido.bark()
     fido.bark()
-    # .name is implemented in Dog and .legs and .tail are inherited from Animal
+    # .name is set in Dog and .legs and .tail are inherited from Animal
     print(f"{fido.name} has {fido.legs} legs and {fido.tail} a tail")
 
     print()
@@ -185,7 +204,7 @@ if __name__ == "__main__":
     # Reptiles don't have a .name, .scales is implemented in Reptile, and .legs and .tail are inherited from Animal
     print(f"A croc has {croc.legs} legs, {croc.tail} a tail and {croc.scales} scales")
 
-    # Create a Lizard object which inherits everything from Reptile (by default due to 'pass') which inherits from Animal
+    # Create a Lizard object which inherits everything from Reptile (it adds nothing of its own) which inherits from Animal
     gecko = Lizard(4)
     # Lizards don't have a .name, .scales is inherited from Reptile, and .legs and .tail are inherited from Animal
     print(f"A gecko has {gecko.legs} legs, {gecko.tail} a tail and {gecko.scales} scales")
@@ -200,8 +219,10 @@ if __name__ == "__main__":
     # Snakes don't have a .name, .venom is implemented in Snake, 
     # tail is reimplemented in Snake to override the parent class's implementation
     # .scales is inherited from Reptile, and .legs is inherited from Animal
-    print(f"A rattlesnake has {rattlesnake.legs} legs, {rattlesnake.tail} a tail, {rattlesnake.scales} scales, "
-                    f"and {rattlesnake.venom} venomous.")
+    # read each attribute once into a local variable, then use the locals
+    legs, tail, scales, venom = rattlesnake.legs, rattlesnake.tail, rattlesnake.scales, rattlesnake.venom
+    print(f"A rattlesnake has {legs} legs, {tail} a tail, {scales} scales, "
+                    f"and {venom} venomous.")
 
     # create another Snake object which also inherits from Reptile which inherits from Animal
     cornsnake = Snake()
@@ -211,8 +232,9 @@ if __name__ == "__main__":
     # Snakes don't have a .name, .venom is implemented in Snake, 
     # tail is reimplemented in Snake to override the parent class's implementation
     # .scales is inherited from Reptile, and .legs is inherited from Animal    
-    print(f"A cornsnake has {cornsnake.legs} legs, {cornsnake.tail} a tail, {cornsnake.scales} scales, "
-                    f"and {cornsnake.venom} venomous.")
+    legs, tail, scales, venom = cornsnake.legs, cornsnake.tail, cornsnake.scales, cornsnake.venom
+    print(f"A cornsnake has {legs} legs, {tail} a tail, {scales} scales, "
+                    f"and {venom} venomous.")
     
     print()
 
@@ -223,14 +245,16 @@ if __name__ == "__main__":
     cornsnake.tail = False
     print(f"A cornsnake without a tail {cornsnake.tail} because it is only a head :D")
     
-    # now we access the behavior of the Snake superclass's .tail implementation
-    print(f"A living cornsnake {super(Snake, cornsnake).tail} a tail")
+    # now we access the behavior of the Snake superclass's .tail implementation.
+    # there is only one _tail value (stored by Animal), so super() reads the
+    # same False as above - it just describes it with Animal's wording
+    print(f"Animal's tail getter says the cornsnake {super(Snake, cornsnake).tail} a tail")
     
     cornsnake.eats = False
     print(f"A cornsnake can eat after it dies: {cornsnake.eats}")
 
     print()
-    # displays the .multicellular class attribute in Animal
+    # displays the .multicellular class attribute inherited from Organism
     print(f"A cornsnake is multicellular: {cornsnake.multicellular}")
     
     
@@ -248,14 +272,12 @@ if __name__ == "__main__":
     # create a new Bacterium object
     strep = Bacterium()
     # displays the .multicellular class attribute in Bacterium,
-    # which is different from Animal and why it is in a different class
+    # which overrides the one Animal inherits from Organism
     print(f"Streptococcus is multicellular: {strep.multicellular}")
 
-    ''' side note: if we wanted, we could create a higher level class called
-        Organism and have Animal and Bacerium inherit from Organism. For example, 
-        the Organism class could have a class attribute has_cell_nucleus = True as
-        something that Animals and Bacteria both share.
-    '''
+
+if __name__ == "__main__":
+    main()
 
 # END annotated multilevel inheritance example
 #     by: Alex Hoffman
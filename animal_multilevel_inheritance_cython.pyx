@@ -0,0 +1,134 @@
+# cython: language_level=3
+# Cython version of the annotated multilevel inheritance example
+#     by: Alex Hoffman
+#
+# Same class hierarchy as animal_multilevel_inheritance_annotated.py,
+# but every class is a "cdef class" (an extension type). Build it with:
+#     python setup.py build_ext --inplace
+# and then import it like any other module:
+#     from animal_multilevel_inheritance_cython import Dog, Snake
+
+cimport cython
+
+# the strings the getters return, indexed by the bint field (0 or 1).
+# as module level cdef tuples they are C globals, so looking one up
+# doesn't go through a python class attribute lookup
+cdef tuple _TAIL_STR = ("does not have", "has")
+cdef tuple _SCALES_STR = ("does not have", "has")
+cdef tuple _VENOM_STR = ("is not", "is")
+cdef tuple _SNAKE_TAIL_STR = ("must be dead", "is mostly")
+
+# @cython.freelist keeps up to N freed Animal objects around so the next
+# Animal() can reuse one instead of asking Python for new memory.
+# it only helps plain Animal objects, though: the freelist is only used
+# for objects exactly the size of an Animal, and Dog, Reptile, Lizard and
+# Snake objects are bigger (they add their own fields), so they always
+# get new memory. Cython won't let a subclass have a freelist of its own
+# ("freelists cannot be used on subtypes"), so Dog and Snake can't get one.
+@cython.freelist(16)
+cdef class Animal:
+    # class attribute - same as in the pure python version
+    multicellular = True
+
+    # a cdef class has no __dict__; every instance attribute must be
+    # declared up front with a C type. "public" lets python code read
+    # and write the attribute, just like a plain python attribute.
+    # bint is a C int that python sees as True/False.
+    cdef public int legs
+    cdef public bint _tail, eats
+
+    def __init__(self, int legs, bint tail):
+        self._init_animal(legs, tail)
+
+    # a cdef method can only be called from Cython code, so calling it
+    # is a plain C function call rather than a python method lookup.
+    # subclasses use it instead of Animal.__init__(self, ...)
+    cdef inline void _init_animal(self, int legs, bint tail):
+        self.legs = legs
+        self._tail = tail
+
+        # a bint can't hold the bool *type*, so eats starts out False
+        self.eats = False
+
+    # properties work the same way they do in a regular python class
+    @property
+    def tail(self):
+        return _TAIL_STR[self._tail]
+
+    @tail.setter
+    def tail(self, tail):
+        self._tail = tail
+
+
+cdef class Dog(Animal):
+    cdef public str name, _sound
+
+    def __init__(self, str name, int legs=4, bint tail=True):
+        self.name = name
+        self._sound = "woof"
+
+        # direct C call to the helper instead of Animal.__init__(self, ...).
+        # Reptile and Snake do the same with Reptile's _init_reptile
+        self._init_animal(legs, tail)
+
+    def bark(self):
+        print(self._sound)
+
+
+cdef class Reptile(Animal):
+    cdef public bint _scales
+
+    def __init__(self, int legs, bint tail=True):
+        self._init_reptile(legs, tail)
+
+    # same idea as Animal's _init_animal - Snake calls this directly
+    # instead of going through Reptile.__init__ / super().__init__
+    cdef inline void _init_reptile(self, int legs, bint tail):
+        self._scales = True
+        self._init_animal(legs, tail)
+
+    @property
+    def scales(self):
+        return _SCALES_STR[self._scales]
+
+    @scales.setter
+    def scales(self, scales):
+        self._scales = scales
+
+
+cdef class Lizard(Reptile):
+    pass
+
+
+cdef class Snake(Reptile):
+    cdef public bint _venom
+
+    # _tail is a C field declared once in Animal, so there is only
+    # ever one copy of it no matter which class's code sets it
+    def __init__(self, int legs=0, bint tail=True):
+        self._venom = False
+        self._init_reptile(legs, tail)
+
+    @property
+    def venom(self):
+        return _VENOM_STR[self._venom]
+
+    @venom.setter
+    def venom(self, has_venom):
+        self._venom = has_venom
+
+    # still python polymorphism: this property overrides Animal's tail
+    @property
+    def tail(self):
+        return _SNAKE_TAIL_STR[self._tail]
+
+    @tail.setter
+    def tail(self, tail):
+        self._tail = tail
+
+
+cdef class Bacterium:
+    multicellular = False
+
+# END Cython multilevel inheritance example
+#     by: Alex Hoffman
@@ -0,0 +1,126 @@
+# Numba jitclass version of the annotated multilevel inheritance example
+#     by: Alex Hoffman
+#
+# A jitclass is compiled by numba into a plain struct with typed fields,
+# so millions of instances take a fraction of the memory of regular
+# python objects and can be created/used inside @njit functions.
+# Needs numba:  pip install numba
+#
+# jitclass has some limits that change how the example is written:
+#   - you can't subclass a jitclass, so the hierarchy is written as
+#     regular python classes (_Animal, _Dog, ...) and each one is then
+#     compiled separately with jitclass(spec)(cls)
+#   - super() isn't supported, so each class saves its parent's __init__
+#     as a class attribute (_init_animal, _init_reptile) and calls that
+#   - methods aren't virtual, so instead of Snake overriding the tail
+#     property, every instance stores a "kind" tag and the python-level
+#     describe functions at the bottom pick the right string with it
+#   - fields are plain bools; turning them into "has"/"does not have"
+#     strings happens in python code outside the compiled classes
+from numba import boolean, int8, int32, types
+from numba.experimental import jitclass
+
+# the kind tags - one per concrete class
+ANIMAL, DOG, REPTILE, LIZARD, SNAKE = range(5)
+
+# the spec lists every field and its numba type, similar to __slots__
+# in the pure python version. each subclass adds to its parent's spec.
+spec_animal = [('kind', int8), ('legs', int32), ('tail', boolean), ('eats', boolean)]
+spec_dog = spec_animal + [('name', types.unicode_type), ('_sound', types.unicode_type)]
+spec_reptile = spec_animal + [('scales', boolean)]
+spec_snake = spec_reptile + [('venom', boolean)]
+
+
+class _Animal:
+    def __init__(self, legs, tail):
+        self.kind = ANIMAL
+        self.legs = legs
+        self.tail = tail
+        self.eats = False
+
+
+class _Dog(_Animal):
+    # stands in for Animal.__init__(self, legs, tail) / super().__init__
+    _init_animal = _Animal.__init__
+
+    def __init__(self, name, legs=4, tail=True):
+        self._init_animal(legs, tail)
+        self.kind = DOG
+        self.name = name
+        self._sound = "woof"
+
+    def bark(self):
+        print(self._sound)
+
+
+class _Reptile(_Animal):
+    _init_animal = _Animal.__init__
+
+    def __init__(self, legs, tail=True):
+        self._init_animal(legs, tail)
+        self.kind = REPTILE
+        self.scales = True
+
+
+class _Lizard(_Reptile):
+    _init_reptile = _Reptile.__init__
+
+    def __init__(self, legs, tail=True):
+        self._init_reptile(legs, tail)
+        self.kind = LIZARD
+
+
+class _Snake(_Reptile):
+    _init_reptile = _Reptile.__init__
+
+    def __init__(self, legs=0, tail=True):
+        self._init_reptile(legs, tail)
+        self.kind = SNAKE
+        self.venom = False
+
+
+# compile each class. these are the names to use from python or @njit code
+Animal = jitclass(spec_animal)(_Animal)
+Dog = jitclass(spec_dog)(_Dog)
+Reptile = jitclass(spec_reptile)(_Reptile)
+Lizard = jitclass(spec_reptile)(_Lizard)
+Snake = jitclass(spec_snake)(_Snake)
+
+
+# python-level formatting, outside the jit boundary. each function
+# picks a string with the same one-line if/else as the pure python getters.
+def describe_tail(critter):
+    # the kind tag replaces Snake overriding the tail property
+    if critter.kind == SNAKE:
+        return "is mostly" if critter.tail else "must be dead"
+    return "has" if critter.tail else "does not have"
+
+
+def describe_scales(reptile):
+    return "has" if reptile.scales else "does not have"
+
+
+def describe_venom(snake):
+    return "is" if snake.venom else "is not"
+
+
+def main():
+    george = Dog('George')
+    george.bark()
+    print(f"{george.name} has {george.legs} legs and {describe_tail(george)} a tail")
+
+    gecko = Lizard(4)
+    print(f"A gecko has {gecko.legs} legs, {describe_tail(gecko)} a tail "
+          f"and {describe_scales(gecko)} scales")
+
+    rattlesnake = Snake()
+    rattlesnake.venom = True
+    print(f"A rattlesnake has {rattlesnake.legs} legs, {describe_tail(rattlesnake)} a tail, "
+          f"{describe_scales(rattlesnake)} scales, and {describe_venom(rattlesnake)} venomous.")
+
+
+if __name__ == "__main__":
+    main()
+
+# END numba multilevel inheritance example
+#     by: Alex Hoffman
@@ -0,0 +1,9 @@
+# Builds the Cython version of the multilevel inheritance example.
+#     python setup.py build_ext --inplace
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="cs140_python",
+    ext_modules=cythonize(["animal_multilevel_inheritance_cython.pyx"]),
+)